@@ -27,6 +27,11 @@ class Settings(BaseSettings):
     # Speech-to-Text Settings
     # Options: "openai_whisper", "google", "deepgram"
     stt_provider: str = "openai_whisper"
+    deepgram_api_key: str = ""  # deepgram streaming transcription api key
+    # wire format the client sends over the websocket.
+    # "webm" (MediaRecorder) or "pcm_s16le" (AudioWorklet raw Int16 frames
+    # at sample_rate; skips server-side container detection/decoding)
+    input_format: str = "webm"
 
     # Audio Settings
     sample_rate: int = 16000
@@ -2,18 +2,59 @@
 Main FastAPI application entry point.
 """
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
 from app.routers import websocket, api
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# strong reference to the background warmup task; the event loop only
+# holds tasks weakly, so without this the warmup can be collected mid-run
+_warmup_task = None
+
+
+async def _warmup():
+    """
+    Warm the expensive lazy paths before the first user request:
+    construct the shared LLM model instances (TLS connection pools) and
+    prime the embedding backend. Failures only cost the warmup benefit,
+    so they are logged and swallowed.
+    """
+    try:
+        from app.services.llm_processor import LLMProcessor
+
+        processor = LLMProcessor()
+        if processor.claude_model or processor.openai_model:
+            # one tiny embedding round-trip primes the local model load or
+            # the HTTP connection to the embeddings endpoint
+            await processor._get_normalized_embedding("warmup")
+        logger.info("Startup warmup complete")
+    except Exception as e:
+        logger.warning(f"Startup warmup skipped: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Kick off warmup in the background so startup is not blocked."""
+    global _warmup_task
+    _warmup_task = asyncio.create_task(_warmup())
+    yield
+    _warmup_task.cancel()
+    _warmup_task = None
+
+
 app = FastAPI(
     title=settings.app_name,
     description="Real-time voice to SVG visualization API",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
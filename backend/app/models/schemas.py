@@ -47,6 +47,8 @@ class SVGGenerationResponse(BaseModel):
     svg_code: str
     description: str
     original_text: str
+    # token usage from the provider (input/output/cached counts), when known
+    usage: Optional[dict] = None
 
 
 class WebSocketMessage(BaseModel):
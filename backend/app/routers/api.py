@@ -95,6 +95,7 @@ async def text_to_svg(request: TextToSVGRequest):
         processed_svg = svg_generator.process_svg(
             response.svg_code,
             sanitize=True,
+            optimize=True,
             responsive=True,
         )
 
@@ -194,6 +195,7 @@ async def transcribe_and_generate(request: TranscribeAndGenerateRequest):
         processed_svg = svg_generator.process_svg(
             svg_response.svg_code,
             sanitize=True,
+            optimize=True,
             responsive=True,
         )
 
@@ -8,6 +8,7 @@ import asyncio
 import base64
 import json
 import logging
+import re
 import time
 from typing import Optional
 
@@ -40,6 +41,29 @@ DEACTIVATE_PHRASES = [
 # legacy single phrase for backwards compatibility
 DEACTIVATE_PHRASE = "thank you"
 
+# "prison" is the most common misrecognition of "prism"; compiled once
+# instead of per transcription chunk
+_PRISON_RE = re.compile(r'\bprison\b', re.IGNORECASE)
+
+# orjson serializes the svg-heavy outgoing payloads several times faster
+# than the stdlib encoder; optional, stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+# except clauses keep working with either loader
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dump_message(message: WebSocketMessage) -> str:
+    """serialize an outgoing websocket message to json text."""
+    payload = message.model_dump()
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload)
+
 
 class ConnectionManager:
     """
@@ -82,7 +106,7 @@ class ConnectionManager:
             message: message to send
         """
         try:
-            await websocket.send_json(message.model_dump())
+            await websocket.send_text(_dump_message(message))
         except Exception as e:
             logger.error(f"failed to send message: {e}")
 
@@ -94,7 +118,7 @@ class ConnectionManager:
             message: message to broadcast
         """
         for connection in self.active_connections:
-            await connection.send_json(message.model_dump())
+            await connection.send_text(_dump_message(message))
 
 
 # global connection manager instance
@@ -385,11 +409,8 @@ class AudioSessionHandler:
         returns:
             text to add to visualization (with trigger words removed)
         """
-        import re
-        lower_text = text.lower()
-
         # replace "prison" with "prism" in the original text for display
-        text = re.sub(r'\bprison\b', 'prism', text, flags=re.IGNORECASE)
+        text = _PRISON_RE.sub('prism', text)
         lower_text = text.lower()
 
         logger.info(f"[TRIGGER] Processing text: '{text[:100]}...' | visualization_active={self.visualization_active}")
@@ -724,6 +745,7 @@ class AudioSessionHandler:
             processed_svg = self.svg_generator.process_svg(
                 response.svg_code,
                 sanitize=True,
+                optimize=True,
                 responsive=True,
             )
 
@@ -786,7 +808,7 @@ async def audio_websocket(websocket: WebSocket):
             raw_message = await websocket.receive_text()
 
             try:
-                message = json.loads(raw_message)
+                message = _json_loads(raw_message)
                 message_type = message.get("type")
 
                 if message_type == MessageType.START_RECORDING.value:
@@ -853,7 +875,7 @@ async def text_to_svg_websocket(websocket: WebSocket):
             raw_message = await websocket.receive_text()
 
             try:
-                message = json.loads(raw_message)
+                message = _json_loads(raw_message)
                 text = message.get("text", "")
                 style = message.get("style")
 
@@ -875,6 +897,7 @@ async def text_to_svg_websocket(websocket: WebSocket):
                 processed_svg = svg_generator.process_svg(
                     response.svg_code,
                     sanitize=True,
+                    optimize=True,
                     responsive=True,
                 )
 
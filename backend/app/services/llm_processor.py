@@ -5,11 +5,17 @@ summaries, and other text processing tasks.
 Uses LangChain for unified interface, retry logic, and fallbacks.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import re
 import time
+from collections import OrderedDict
 from typing import Any, Optional, Tuple
 
+import numpy as np
+
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -18,10 +24,57 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 
 from app.config import get_settings
 from app.models.schemas import SVGGenerationRequest, SVGGenerationResponse
+from app.services.vector_ops import cosine_similarity_matrix
+
+# provider integrations are optional; import once at module load instead of
+# re-resolving them on every processor construction
+try:
+    from langchain_anthropic import ChatAnthropic
+    _ANTHROPIC_AVAILABLE = True
+except ImportError:
+    ChatAnthropic = None
+    _ANTHROPIC_AVAILABLE = False
+
+try:
+    from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+    _OPENAI_AVAILABLE = True
+except ImportError:
+    ChatOpenAI = None
+    OpenAIEmbeddings = None
+    _OPENAI_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# single-pass escape table for user text embedded in SVG output; also
+# covers "&", which the old chained .replace() calls missed
+_SVG_TEXT_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# precompiled patterns for summary post-processing; compiled once at import
+# instead of on every summary call
+_ATTRIBUTION_RES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\b(the )?(user|speaker|presenter)\s+"
+        r"(stated|states|said|says|mentioned|mentions|noted|notes|"
+        r"described|describes|explained|explains|shared|shares)( that)?\b",
+        r"\baccording to (the )?(user|speaker|presenter|transcript)\b[:,]?",
+        r"\b(the )?transcript\s+(stated|states|said|says|shows|indicates)( that)?\b",
+        r"\bit was (stated|said|mentioned|noted|described|explained) that\b",
+        r"\bfrom (the )?(user|speaker|transcript)\b[:,]?",
+    )
+]
+_LEADING_FILLER_RE = re.compile(r"^\s*(that|about|regarding)\s+", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+_LEADING_MARKUP_RE = re.compile(r"^[#>\-*]+")
+_BULLET_RE = re.compile(r"^([*-]|•|\d+[.)])\s+")
+_HEADING_RE = re.compile(
+    r"^(#{1,6}\s*)?(key concepts?|key details?|takeaways?|summary|main ideas?)\s*:?\s*$",
+    re.IGNORECASE,
+)
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
 
 # ============================================================================
 # PROMPTS
@@ -85,6 +138,441 @@ INSTRUCTIONS:
 - Output only the complete updated SVG code"""
 
 
+# message objects are immutable per-invocation, so the system messages are
+# built once here instead of constructing a fresh SystemMessage (and
+# re-validating its content) on every call. Keeping one shared instance
+# also gives providers a byte-identical prompt prefix, the precondition
+# for server-side prompt caching (see the cache-floor note below).
+_SVG_SYSTEM_MESSAGE = SystemMessage(content=SVG_SYSTEM_PROMPT)
+_SUMMARY_SYSTEM_MESSAGE = SystemMessage(content=SUMMARY_SYSTEM_PROMPT)
+_GRAMMAR_SYSTEM_MESSAGE = SystemMessage(content=GRAMMAR_SYSTEM_PROMPT)
+
+
+# ============================================================================
+# PROMPT CACHE FEASIBILITY
+# ============================================================================
+# Provider-side prompt caching only engages above a minimum stable prefix
+# (1024 tokens for OpenAI, more for others). Measure the system prompt once
+# at import so "caching never fires" is visible at startup instead of being
+# silently assumed.
+
+_PROMPT_CACHE_MIN_TOKENS = 1024
+
+
+def _count_tokens(text: str) -> int:
+    """Count tokens with tiktoken when available, else a chars/4 estimate."""
+    try:
+        import tiktoken
+        return len(tiktoken.encoding_for_model("gpt-4o").encode(text))
+    except Exception:
+        return len(text) // 4
+
+
+_SYSTEM_PROMPT_TOKENS = _count_tokens(SVG_SYSTEM_PROMPT)
+if _SYSTEM_PROMPT_TOKENS < _PROMPT_CACHE_MIN_TOKENS:
+    logger.info(
+        f"SVG system prompt is ~{_SYSTEM_PROMPT_TOKENS} tokens, below the "
+        f"{_PROMPT_CACHE_MIN_TOKENS}-token provider prompt-cache floor; "
+        f"repeat calls will not benefit from provider prefix caching"
+    )
+
+
+# ============================================================================
+# SHARED MODEL INSTANCES
+# ============================================================================
+# The app constructs a fresh LLMProcessor per request/session. Each
+# ChatAnthropic/ChatOpenAI/OpenAIEmbeddings instance owns its own HTTP
+# connection pool, so per-processor construction defeated connection reuse
+# and paid a TLS handshake on every first call. The model objects are
+# stateless per-invocation, so they are built once and shared here.
+
+_shared_models: dict[str, Any] = {}
+
+# one async HTTP client behind the OpenAI chat and embeddings models: a
+# single connection pool shared across processor instances, with HTTP/2
+# multiplexing concurrent requests over one TLS connection when the
+# optional h2 package is installed
+_openai_http_client: Optional[Any] = None
+
+
+def _get_openai_http_client():
+    """Return the shared httpx.AsyncClient, creating it on first use."""
+    global _openai_http_client
+    if _openai_http_client is None:
+        import httpx
+
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=20)
+        timeout = httpx.Timeout(60.0, connect=10.0)
+        try:
+            _openai_http_client = httpx.AsyncClient(
+                http2=True, limits=limits, timeout=timeout
+            )
+        except ImportError:
+            # http2=True requires the h2 extra; fall back to HTTP/1.1
+            logger.info("h2 not installed; OpenAI HTTP client using HTTP/1.1")
+            _openai_http_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+    return _openai_http_client
+
+
+# ============================================================================
+# STATIC SVG TEMPLATES
+# ============================================================================
+# The mock SVG is static except for the user text, so it is split once at
+# import around the text slot; the call path is then two concatenations
+# instead of re-evaluating a ~1KB f-string per request.
+
+_MOCK_SVG_TEMPLATE = """<svg viewBox="0 0 400 300" xmlns="http://www.w3.org/2000/svg">
+  <defs>
+    <linearGradient id="bgGradient" x1="0%" y1="0%" x2="100%" y2="100%">
+      <stop offset="0%" style="stop-color:#667eea;stop-opacity:1" />
+      <stop offset="100%" style="stop-color:#764ba2;stop-opacity:1" />
+    </linearGradient>
+  </defs>
+  <rect width="400" height="300" fill="url(#bgGradient)"/>
+  <circle cx="50" cy="50" r="30" fill="rgba(255,255,255,0.1)"/>
+  <circle cx="350" cy="250" r="50" fill="rgba(255,255,255,0.1)"/>
+  <text x="200" y="140" text-anchor="middle" font-family="system-ui" font-size="16" fill="white" font-weight="bold">
+    Mock Visualization
+  </text>
+  <text x="200" y="170" text-anchor="middle" font-family="system-ui" font-size="12" fill="rgba(255,255,255,0.8)">
+    {text_slot}
+  </text>
+  <text x="200" y="270" text-anchor="middle" font-family="system-ui" font-size="10" fill="rgba(255,255,255,0.6)">
+    Configure API keys for real generation
+  </text>
+</svg>"""
+
+_MOCK_SVG_PREFIX, _MOCK_SVG_SUFFIX = _MOCK_SVG_TEMPLATE.split("{text_slot}")
+
+# the fallback SVG gets the same treatment: split once around its two
+# dynamic slots (input snippet and error message)
+_FALLBACK_SVG_TEMPLATE = """<svg viewBox="0 0 400 300" xmlns="http://www.w3.org/2000/svg">
+  <rect width="400" height="300" fill="#f8f9fa" stroke="#dee2e6" stroke-width="2"/>
+  <text x="200" y="130" text-anchor="middle" font-family="system-ui" font-size="14" fill="#6c757d">
+    Unable to generate visualization
+  </text>
+  <text x="200" y="160" text-anchor="middle" font-family="system-ui" font-size="12" fill="#adb5bd">
+    Input: {text_slot}...
+  </text>
+  <text x="200" y="190" text-anchor="middle" font-family="system-ui" font-size="10" fill="#dc3545">
+    {error_slot}
+  </text>
+</svg>"""
+
+_FALLBACK_SVG_PREFIX, _fallback_tail = _FALLBACK_SVG_TEMPLATE.split("{text_slot}")
+_FALLBACK_SVG_MID, _FALLBACK_SVG_SUFFIX = _fallback_tail.split("{error_slot}")
+del _fallback_tail
+
+
+# ============================================================================
+# LOCAL EMBEDDER (optional)
+# ============================================================================
+# Embedding every semantic-cache miss through the OpenAI API costs a network
+# round-trip that can exceed what the cache saves on short prompts. When
+# fastembed is installed (ONNX Runtime inference with quantized weights,
+# single-digit-ms per sentence on CPU) prompts are embedded locally instead.
+# The model loads lazily and inference runs in a worker thread so the event
+# loop is never blocked. Whichever embedder wins on first use stays in
+# effect for the process, keeping all cached vectors in one embedding space.
+
+_LOCAL_EMBED_MODEL = "BAAI/bge-small-en-v1.5"
+_local_embedder = None
+_local_embedder_unavailable = False
+
+
+def _embed_local_sync(texts: list[str]) -> Optional[list[np.ndarray]]:
+    """Load the local embedder on first use and embed the given texts."""
+    global _local_embedder, _local_embedder_unavailable
+
+    if _local_embedder_unavailable:
+        return None
+
+    if _local_embedder is None:
+        try:
+            from fastembed import TextEmbedding
+
+            _local_embedder = TextEmbedding(model_name=_LOCAL_EMBED_MODEL)
+            logger.info(f"Local ONNX embedder initialized: {_LOCAL_EMBED_MODEL}")
+        except ImportError:
+            logger.info("fastembed not installed, semantic cache uses the embeddings API")
+            _local_embedder_unavailable = True
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to initialize local embedder: {e}")
+            _local_embedder_unavailable = True
+            return None
+
+    return [np.asarray(vector, dtype=np.float32) for vector in _local_embedder.embed(texts)]
+
+
+async def _embed_local(texts: list[str]) -> Optional[list[np.ndarray]]:
+    """Embed texts with the local ONNX model, off the event loop."""
+    return await asyncio.to_thread(_embed_local_sync, texts)
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+# Exact-match LRU cache for generated SVG responses, shared across processor
+# instances (the app constructs a fresh LLMProcessor per request/session).
+# Keyed on a blake2b hash of (model, text, style, context) so identical
+# requests skip the LLM round-trip entirely.
+
+_RESPONSE_CACHE: "OrderedDict[str, SVGGenerationResponse]" = OrderedDict()
+_RESPONSE_CACHE_SIZE = 512
+
+
+def _response_cache_get(key: str) -> Optional[SVGGenerationResponse]:
+    """Look up a cached response and refresh its LRU position."""
+    response = _RESPONSE_CACHE.get(key)
+    if response is not None:
+        _RESPONSE_CACHE.move_to_end(key)
+    return response
+
+
+def _response_cache_put(key: str, response: SVGGenerationResponse):
+    """Store a response, evicting the least recently used entry if full."""
+    _RESPONSE_CACHE[key] = response
+    _RESPONSE_CACHE.move_to_end(key)
+    while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+        _RESPONSE_CACHE.popitem(last=False)
+
+
+# in-flight generations keyed like the response cache: concurrent duplicate
+# requests await the first caller's Future instead of each firing an LLM call
+_INFLIGHT: "dict[str, asyncio.Future[SVGGenerationResponse]]" = {}
+
+
+# ============================================================================
+# SEMANTIC CACHE
+# ============================================================================
+# Second cache rung behind the exact-match cache: paraphrased prompts
+# ("what is France's capital?" vs "capital of France?") should hit the same
+# cached SVG. Prompt embeddings are L2-normalized at insert and kept in one
+# contiguous float32 matrix so a lookup is a single matrix-vector product.
+# Only plain-text requests (no style/context) participate, so a hit can never
+# return an SVG generated under different style instructions.
+
+_SEMANTIC_CACHE_SIZE = 256
+_SEMANTIC_CACHE_THRESHOLD = 0.92
+_semantic_cache_matrix: Optional[np.ndarray] = None
+_semantic_cache_responses: list[SVGGenerationResponse] = []
+
+
+def _semantic_cache_lookup(embedding: np.ndarray) -> Optional[SVGGenerationResponse]:
+    """Return the cached response most similar to the embedding, if any."""
+    if _semantic_cache_matrix is None or not _semantic_cache_responses:
+        return None
+
+    # dimensions can only differ if the embedding backend changed mid-process
+    if _semantic_cache_matrix.shape[1] != embedding.shape[0]:
+        return None
+
+    similarities = _semantic_cache_matrix @ embedding
+    best_idx = int(np.argmax(similarities))
+    if similarities[best_idx] >= _SEMANTIC_CACHE_THRESHOLD:
+        return _semantic_cache_responses[best_idx]
+    return None
+
+
+def _semantic_cache_add(embedding: np.ndarray, response: SVGGenerationResponse):
+    """Append a normalized embedding and response, evicting oldest if full."""
+    global _semantic_cache_matrix
+
+    if _semantic_cache_matrix is None:
+        _semantic_cache_matrix = embedding.reshape(1, -1)
+    else:
+        _semantic_cache_matrix = np.vstack([_semantic_cache_matrix, embedding])
+    _semantic_cache_responses.append(response)
+
+    if len(_semantic_cache_responses) > _SEMANTIC_CACHE_SIZE:
+        _semantic_cache_matrix = _semantic_cache_matrix[1:]
+        _semantic_cache_responses.pop(0)
+
+
+# embedding memoization: normalized vectors keyed by text, shared across
+# processor instances so repeated similarity checks skip the embedding call
+_EMBEDDING_CACHE: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_EMBEDDING_CACHE_SIZE = 1024
+
+# near-duplicate prefilter for topic similarity: texts are fingerprinted as
+# a 1024-bit mask of hashed character 3-gram shingles, so a cheap bitwise
+# Jaccard estimate can short-circuit the embedding call for texts that are
+# (almost) restatements of each other
+_FINGERPRINT_BITS = 1024
+_FINGERPRINT_DUP_THRESHOLD = 0.9
+# long texts set most of the 1024 bits, at which point any two long texts
+# overlap heavily and the Jaccard estimate stops meaning anything; the
+# prefilter only applies while both masks are at most half full
+_FINGERPRINT_MAX_BITS_SET = _FINGERPRINT_BITS // 2
+
+
+def _shingle_fingerprint(text: str) -> int:
+    """Fingerprint text as a 1024-bit mask of its 3-gram shingles."""
+    lowered = text.lower()
+    fingerprint = 0
+    for i in range(len(lowered) - 2):
+        fingerprint |= 1 << (hash(lowered[i:i + 3]) % _FINGERPRINT_BITS)
+    return fingerprint
+
+
+# ============================================================================
+# MICRO-BATCHER
+# ============================================================================
+# Requests arriving within a short window are folded into one multi-item
+# chat call, amortizing the per-call overhead (system prompt processing,
+# request framing, round-trip) across the batch. Opt-in via
+# LLMProcessor.generate_svg_batched; generate_svg is untouched.
+
+_BATCH_MAX_SIZE = 8
+_BATCH_WINDOW_S = 0.02  # 20 ms collection window
+
+# polling budget for non-urgent summaries sent through the OpenAI Batch API
+_SUMMARY_BATCH_TIMEOUT_S = 600
+_SUMMARY_BATCH_POLL_S = 10
+
+_BATCH_SYSTEM_PROMPT = SVG_SYSTEM_PROMPT + """
+
+You will receive several numbered items. Generate one SVG per item and
+return ONLY a JSON array of objects shaped like {"id": <number>, "svg": "<svg.../svg>"}."""
+
+_BATCH_SYSTEM_MESSAGE = SystemMessage(content=_BATCH_SYSTEM_PROMPT)
+
+
+class _SVGBatcher:
+    """
+    Collects concurrent SVG generation requests into small batches.
+    Each batch is dispatched as a single LLM call whose response is a JSON
+    array routing one SVG back to each waiting caller.
+    """
+
+    def __init__(self):
+        self._queue: "asyncio.Queue[tuple] " = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(
+        self, processor: "LLMProcessor", request: SVGGenerationRequest
+    ) -> SVGGenerationResponse:
+        """Enqueue a request and wait for its batched response."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((processor, request, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self):
+        """Collect pending requests into batches and dispatch them."""
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            try:
+                while len(batch) < _BATCH_MAX_SIZE:
+                    item = await asyncio.wait_for(
+                        self._queue.get(), timeout=_BATCH_WINDOW_S
+                    )
+                    batch.append(item)
+            except asyncio.TimeoutError:
+                pass
+
+            processor = batch[0][0]
+            if len(batch) == 1:
+                _, request, future = batch[0]
+                await self._resolve_individually([(processor, request, future)])
+            else:
+                await self._dispatch_batch(processor, batch)
+
+    async def _dispatch_batch(self, processor: "LLMProcessor", batch: list):
+        """Send one composite prompt for the whole batch and route results."""
+        model = processor._get_model_with_fallback()
+        if not model:
+            await self._resolve_individually(batch)
+            return
+
+        items = []
+        for idx, (_, request, _) in enumerate(batch, 1):
+            line = f"Item {idx}: {request.text}"
+            if request.style:
+                line += f" (style: {request.style})"
+            if request.context:
+                line += f" (context: {request.context})"
+            items.append(line)
+
+        messages = [
+            _BATCH_SYSTEM_MESSAGE,
+            HumanMessage(content="\n".join(items)),
+        ]
+
+        try:
+            logger.info(f"[SVG_BATCH] Dispatching batch of {len(batch)} requests")
+            response = await model.ainvoke(messages)
+            by_id = self._parse_batch_response(processor, response.content)
+        except Exception as e:
+            logger.error(f"[SVG_BATCH] Batched call failed: {e}")
+            by_id = {}
+
+        unresolved = []
+        for idx, (proc, request, future) in enumerate(batch, 1):
+            svg_code = by_id.get(idx)
+            if svg_code and not future.done():
+                future.set_result(
+                    SVGGenerationResponse(
+                        svg_code=svg_code,
+                        description=f"Visualization generated for: {request.text}",
+                        original_text=request.text,
+                    )
+                )
+            elif not future.done():
+                unresolved.append((proc, request, future))
+
+        if unresolved:
+            logger.warning(
+                f"[SVG_BATCH] {len(unresolved)} item(s) missing from batch response, "
+                f"falling back to individual generation"
+            )
+            await self._resolve_individually(unresolved)
+
+    def _parse_batch_response(
+        self, processor: "LLMProcessor", content
+    ) -> dict[int, str]:
+        """Parse the JSON array response into an id -> svg mapping."""
+        text = processor._get_text_content(content)
+        start = text.find("[")
+        end = text.rfind("]")
+        if start < 0 or end <= start:
+            return {}
+
+        try:
+            entries = json.loads(text[start:end + 1])
+        except (json.JSONDecodeError, ValueError):
+            return {}
+
+        results: dict[int, str] = {}
+        for entry in entries:
+            if isinstance(entry, dict) and "svg" in entry:
+                try:
+                    results[int(entry.get("id", 0))] = str(entry["svg"])
+                except (TypeError, ValueError):
+                    continue
+        return results
+
+    async def _resolve_individually(self, batch: list):
+        """Fall back to one generate_svg call per unresolved request."""
+        async def _run(proc, request, future):
+            try:
+                result = await proc.generate_svg(request)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+
+        await asyncio.gather(
+            *(_run(proc, request, future) for proc, request, future in batch)
+        )
+
+
+_svg_batcher = _SVGBatcher()
+
+
 # ============================================================================
 # LLM PROCESSOR CLASS
 # ============================================================================
@@ -110,50 +598,63 @@ class LLMProcessor:
         self._initialize_models()
 
     def _initialize_models(self):
-        """Initialize LangChain models with proper configuration."""
+        """Initialize LangChain models, reusing shared instances when present."""
         # Initialize Claude model for SVG generation
-        try:
-            from langchain_anthropic import ChatAnthropic
-
-            if settings.claude_key:
-                self.claude_model = ChatAnthropic(
-                    model=self.model if self.model.startswith("claude") else "claude-sonnet-4-6",
-                    api_key=settings.claude_key,
-                    max_tokens=2048,  # Minimal for fast SVGs
-                    temperature=0.7,
-                    max_retries=3,
-                )
-                logger.info(f"LangChain Claude model initialized: {self.model}")
-            else:
-                logger.warning("Claude API key not configured")
-        except ImportError as e:
-            logger.warning(f"langchain-anthropic not installed: {e}")
-        except Exception as e:
-            logger.error(f"Failed to initialize Claude model: {e}")
+        claude_cache_key = f"claude:{self.model}"
+        if claude_cache_key in _shared_models:
+            self.claude_model = _shared_models[claude_cache_key]
+        elif not _ANTHROPIC_AVAILABLE:
+            logger.warning("langchain-anthropic not installed")
+        else:
+            try:
+                if settings.claude_key:
+                    self.claude_model = ChatAnthropic(
+                        model=self.model if self.model.startswith("claude") else "claude-sonnet-4-6",
+                        api_key=settings.claude_key,
+                        max_tokens=2048,  # Minimal for fast SVGs
+                        temperature=0.7,
+                        max_retries=3,
+                    )
+                    _shared_models[claude_cache_key] = self.claude_model
+                    logger.info(f"LangChain Claude model initialized: {self.model}")
+                else:
+                    logger.warning("Claude API key not configured")
+            except Exception as e:
+                logger.error(f"Failed to initialize Claude model: {e}")
 
         # Initialize OpenAI model for fallback and utilities
-        try:
-            from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-
-            if settings.openai_api_key:
-                self.openai_model = ChatOpenAI(
-                    model="gpt-4o-mini",
-                    api_key=settings.openai_api_key,
-                    max_tokens=2048,  # Minimal for fast SVGs
-                    temperature=0.7,
-                    max_retries=3,
-                )
-                self.openai_embeddings = OpenAIEmbeddings(
-                    model="text-embedding-3-small",
-                    api_key=settings.openai_api_key,
-                )
-                logger.info("LangChain OpenAI models initialized")
-            else:
-                logger.warning("OpenAI API key not configured")
-        except ImportError as e:
-            logger.warning(f"langchain-openai not installed: {e}")
-        except Exception as e:
-            logger.error(f"Failed to initialize OpenAI models: {e}")
+        if "openai" in _shared_models:
+            self.openai_model = _shared_models["openai"]
+            self.openai_embeddings = _shared_models.get("openai_embeddings")
+        elif not _OPENAI_AVAILABLE:
+            logger.warning("langchain-openai not installed")
+        else:
+            try:
+                if settings.openai_api_key:
+                    self.openai_model = ChatOpenAI(
+                        model="gpt-4o-mini",
+                        api_key=settings.openai_api_key,
+                        max_tokens=2048,  # Minimal for fast SVGs
+                        temperature=0.7,
+                        max_retries=3,
+                        http_async_client=_get_openai_http_client(),
+                    )
+                    self.openai_embeddings = OpenAIEmbeddings(
+                        model="text-embedding-3-small",
+                        api_key=settings.openai_api_key,
+                        # Matryoshka truncation: 512 dims keeps ~99% of the
+                        # full model's similarity quality at a third of the
+                        # payload and dot-product cost
+                        dimensions=512,
+                        http_async_client=_get_openai_http_client(),
+                    )
+                    _shared_models["openai"] = self.openai_model
+                    _shared_models["openai_embeddings"] = self.openai_embeddings
+                    logger.info("LangChain OpenAI models initialized")
+                else:
+                    logger.warning("OpenAI API key not configured")
+            except Exception as e:
+                logger.error(f"Failed to initialize OpenAI models: {e}")
 
     def _get_primary_model(self):
         """Get the primary model based on configuration."""
@@ -197,44 +698,119 @@ class LLMProcessor:
         # Ensure we have a string
         response_text = self._get_text_content(response_text)
 
-        # First try to find complete SVG
-        svg_pattern = r"<svg[\s\S]*?</svg>"
-        match = re.search(svg_pattern, response_text, re.IGNORECASE)
-        if match:
-            return match.group(0)
-
-        # Check if SVG was truncated (has opening but no closing tag)
-        svg_start = re.search(r"<svg[^>]*>", response_text, re.IGNORECASE)
-        if svg_start:
-            logger.warning("SVG appears truncated (no closing tag), attempting to repair...")
-            # Extract from <svg> to end and close any open tags
-            svg_content = response_text[svg_start.start():]
-            # Close the SVG tag
-            if "</svg>" not in svg_content.lower():
-                svg_content = svg_content.rstrip() + "\n</svg>"
-            logger.info(f"Repaired truncated SVG, length: {len(svg_content)}")
-            return svg_content
-
-        logger.warning(f"No SVG tags found in LLM response. Response preview: {response_text[:500]}...")
-        return response_text
+        # Locate the SVG bounds with two linear scans. str.find runs in C
+        # with no backtracking, so adversarial LLM output cannot blow up
+        # extraction time the way the old lazy regex could.
+        lowered = response_text.lower()
+        start = lowered.find("<svg")
+        if start < 0:
+            logger.warning(f"No SVG tags found in LLM response. Response preview: {response_text[:500]}...")
+            return response_text
+
+        end = lowered.find("</svg>", start)
+        if end >= 0:
+            return response_text[start:end + len("</svg>")]
+
+        # SVG was truncated (has opening but no closing tag)
+        logger.warning("SVG appears truncated (no closing tag), attempting to repair...")
+        tail = response_text[start:].rstrip()
+        # a trailing code fence can survive the slice when the model closed
+        # its ``` block but never emitted </svg>; drop it before repairing
+        if tail.endswith("```"):
+            tail = tail[:-3].rstrip()
+        # likewise drop a dangling partially-emitted element ("<rect x=")
+        # so the appended close tag yields parseable markup
+        last_open = tail.rfind("<")
+        if last_open > 0 and tail.find(">", last_open) < 0:
+            tail = tail[:last_open].rstrip()
+        svg_content = tail + "\n</svg>"
+        logger.info(f"Repaired truncated SVG, length: {len(svg_content)}")
+        return svg_content
+
+    def _cache_key(self, request: SVGGenerationRequest) -> str:
+        """Compute the exact-match cache key for an SVG generation request."""
+        raw = f"{self.model}|{request.text}|{request.style}|{request.context}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _extract_usage(self, response) -> Optional[dict]:
+        """
+        Collect token usage from a model response, including how many
+        prompt tokens hit the provider-side cache. Logged so prompt-cache
+        regressions are visible as the prompts evolve.
+        """
+        usage = getattr(response, "usage_metadata", None)
+        if not usage:
+            return None
+
+        details = usage.get("input_token_details") or {}
+        cached = details.get("cache_read", 0)
+        input_tokens = usage.get("input_tokens", 0)
+        if input_tokens:
+            logger.info(
+                f"[SVG_LLM] Tokens: input={input_tokens}, "
+                f"output={usage.get('output_tokens', 0)}, cached={cached} "
+                f"(cache_hit_ratio={cached / input_tokens:.2f})"
+            )
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": usage.get("output_tokens", 0),
+            "cached_tokens": cached,
+        }
+
+    async def _embed_prompt(self, text: str) -> Optional[np.ndarray]:
+        """Embed a prompt for the semantic cache, L2-normalized float32."""
+        try:
+            # prefer the local quantized embedder; fall back to the API
+            local = await _embed_local([text])
+            if local:
+                vector = local[0]
+            elif self.openai_embeddings:
+                embedding = await self.openai_embeddings.aembed_query(text)
+                vector = np.asarray(embedding, dtype=np.float32)
+            else:
+                return None
+
+            norm = np.linalg.norm(vector)
+            if norm == 0:
+                return None
+            return vector / norm
+        except Exception as e:
+            logger.warning(f"Prompt embedding for semantic cache failed: {e}")
+            return None
+
+    async def _get_normalized_embedding(self, text: str) -> Optional[np.ndarray]:
+        """Embed text L2-normalized, memoized in a shared LRU cache."""
+        cached = _EMBEDDING_CACHE.get(text)
+        if cached is not None:
+            _EMBEDDING_CACHE.move_to_end(text)
+            # stored as float16 to halve cache memory; upcast for scoring
+            return cached.astype(np.float32)
+
+        vector = await self._embed_prompt(text)
+        if vector is None:
+            return None
+
+        _EMBEDDING_CACHE[text] = vector.astype(np.float16)
+        while len(_EMBEDDING_CACHE) > _EMBEDDING_CACHE_SIZE:
+            _EMBEDDING_CACHE.popitem(last=False)
+        return vector
 
     def _create_fallback_svg(self, text: str, error: str) -> str:
         """Create a fallback SVG when generation fails."""
-        escaped_text = text[:50].replace("<", "&lt;").replace(">", "&gt;")
-        escaped_error = str(error)[:100].replace("<", "&lt;").replace(">", "&gt;")
-
-        return f"""<svg viewBox="0 0 400 300" xmlns="http://www.w3.org/2000/svg">
-  <rect width="400" height="300" fill="#f8f9fa" stroke="#dee2e6" stroke-width="2"/>
-  <text x="200" y="130" text-anchor="middle" font-family="system-ui" font-size="14" fill="#6c757d">
-    Unable to generate visualization
-  </text>
-  <text x="200" y="160" text-anchor="middle" font-family="system-ui" font-size="12" fill="#adb5bd">
-    Input: {escaped_text}...
-  </text>
-  <text x="200" y="190" text-anchor="middle" font-family="system-ui" font-size="10" fill="#dc3545">
-    {escaped_error}
-  </text>
-</svg>"""
+        # truncate before escaping so the escape pass is bounded to the
+        # display snippet no matter how large the original input was
+        text_snippet = text[:50]
+        error_snippet = str(error)[:100]
+        escaped_text = text_snippet.translate(_SVG_TEXT_ESCAPE)
+        escaped_error = error_snippet.translate(_SVG_TEXT_ESCAPE)
+
+        return "".join((
+            _FALLBACK_SVG_PREFIX,
+            escaped_text,
+            _FALLBACK_SVG_MID,
+            escaped_error,
+            _FALLBACK_SVG_SUFFIX,
+        ))
 
     # =========================================================================
     # TEXT EMBEDDING & SEMANTIC SIMILARITY
@@ -255,21 +831,48 @@ class LLMProcessor:
     # NOTE: Currently not actively used - see websocket.py for commented usage
     # =========================================================================
 
-    def _cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        import math
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        magnitude1 = math.sqrt(sum(a * a for a in vec1))
-        magnitude2 = math.sqrt(sum(b * b for b in vec2))
-        if magnitude1 == 0 or magnitude2 == 0:
+    def _cosine_similarity(self, vec1, vec2) -> float:
+        """Calculate cosine similarity between two vectors (lists or arrays)."""
+        a = np.asarray(vec1, dtype=np.float32)
+        b = np.asarray(vec2, dtype=np.float32)
+        if not a.any() or not b.any():
             return 0.0
-        return dot_product / (magnitude1 * magnitude2)
+        return float(np.dot(a, b) / np.sqrt(np.vdot(a, a) * np.vdot(b, b)))
+
+    @staticmethod
+    def _cosine_unit(vec1: np.ndarray, vec2: np.ndarray) -> float:
+        """
+        Cosine similarity for vectors already known to be unit length
+        (everything produced by _embed_prompt / _get_normalized_embedding).
+        Skips the magnitude computation _cosine_similarity pays for
+        arbitrary inputs.
+        """
+        return float(vec1 @ vec2)
+
+    def _word_overlap(self, text1: str, text2: str) -> float:
+        """
+        Jaccard word overlap, used when embeddings are unavailable.
+        Tokens are hashed to int64 and compared with NumPy set operations,
+        avoiding Python-level set building on longer transcripts.
+        """
+        tokens1 = text1.lower().split()
+        tokens2 = text2.lower().split()
+        if not tokens1 or not tokens2:
+            return 0.0
+
+        hashes1 = np.unique(np.fromiter((hash(t) for t in tokens1), dtype=np.int64))
+        hashes2 = np.unique(np.fromiter((hash(t) for t in tokens2), dtype=np.int64))
+        shared = np.intersect1d(hashes1, hashes2, assume_unique=True).size
+        union = hashes1.size + hashes2.size - shared
+        return shared / union if union else 0.0
 
     async def check_topic_similarity(
         self,
         text1: str,
         text2: str,
-        threshold: float = 0.75
+        # truncated 512-dim embeddings compress the score range slightly,
+        # so the similarity cutoff is retuned from 0.75 to 0.70
+        threshold: float = 0.70
     ) -> Tuple[bool, float]:
         """
         Check if two text segments are about the same topic using embeddings.
@@ -283,17 +886,45 @@ class LLMProcessor:
         Returns:
             Tuple of (is_similar: bool, similarity_score: float)
         """
-        if not self.openai_embeddings:
-            # Fallback: simple word overlap
-            words1 = set(text1.lower().split())
-            words2 = set(text2.lower().split())
-            overlap = len(words1 & words2) / max(len(words1 | words2), 1)
-            return overlap > 0.3, overlap
+        # near-duplicate prefilter: when the shingle fingerprints almost
+        # fully overlap the texts are restatements of the same content, so
+        # the embedding round-trip can be skipped outright. saturated masks
+        # (long transcripts) are excluded — see _FINGERPRINT_MAX_BITS_SET
+        fp1 = _shingle_fingerprint(text1)
+        fp2 = _shingle_fingerprint(text2)
+        if (
+            fp1 and fp2
+            and fp1.bit_count() <= _FINGERPRINT_MAX_BITS_SET
+            and fp2.bit_count() <= _FINGERPRINT_MAX_BITS_SET
+        ):
+            shingle_jaccard = (fp1 & fp2).bit_count() / (fp1 | fp2).bit_count()
+            if shingle_jaccard >= _FINGERPRINT_DUP_THRESHOLD:
+                logger.info(
+                    f"Topic similarity short-circuit: shingle overlap "
+                    f"{shingle_jaccard:.3f} >= {_FINGERPRINT_DUP_THRESHOLD}"
+                )
+                return True, shingle_jaccard
 
         try:
-            # Use LangChain embeddings
-            embeddings = await self.openai_embeddings.aembed_documents([text1, text2])
-            similarity = self._cosine_similarity(embeddings[0], embeddings[1])
+            # memoized normalized embeddings: repeated texts (the previous
+            # visualization's prompt, typically) skip the embedding call, and
+            # similarity reduces to a dot product of unit vectors. The
+            # embeddings come from the local quantized model when fastembed
+            # is installed (see _embed_prompt), so this path works without
+            # an OpenAI key; only when no backend can embed do we drop to
+            # word overlap
+            # both lookups run concurrently; on a double cache miss the two
+            # embedding calls overlap instead of serializing
+            v1, v2 = await asyncio.gather(
+                self._get_normalized_embedding(text1),
+                self._get_normalized_embedding(text2),
+            )
+            if v1 is None or v2 is None:
+                # no embedding backend (keyless dev setup without fastembed):
+                # word overlap is the expected path, not an error
+                overlap = self._word_overlap(text1, text2)
+                return overlap > 0.3, overlap
+            similarity = self._cosine_unit(v1, v2)
             is_similar = similarity >= threshold
 
             logger.info(
@@ -305,11 +936,69 @@ class LLMProcessor:
         except Exception as e:
             logger.error(f"Embedding similarity check error: {e}")
             # Fallback to word overlap
-            words1 = set(text1.lower().split())
-            words2 = set(text2.lower().split())
-            overlap = len(words1 & words2) / max(len(words1 | words2), 1)
+            overlap = self._word_overlap(text1, text2)
             return overlap > 0.3, overlap
 
+    async def check_topic_similarity_batch(
+        self,
+        query: str,
+        candidates: list[str],
+        # truncated 512-dim embeddings compress the score range slightly,
+        # so the similarity cutoff is retuned from 0.75 to 0.70
+        threshold: float = 0.70
+    ) -> list[Tuple[bool, float]]:
+        """
+        Score one query text against many candidate texts at once.
+
+        All texts go out in a single embeddings call, and the candidate
+        scores are computed in one batched matrix product (see
+        vector_ops.cosine_similarity_matrix) instead of N pairwise calls.
+
+        Args:
+            query: Text segment to compare against each candidate
+            candidates: Candidate text segments
+            threshold: Similarity threshold (0-1)
+
+        Returns:
+            List of (is_similar, similarity_score) tuples, one per candidate
+        """
+        if not candidates:
+            return []
+
+        if not self.openai_embeddings:
+            # the local quantized embedder keeps semantic scoring available
+            # without an OpenAI key
+            local = await _embed_local([query, *candidates])
+            if local:
+                matrix = np.vstack(local)
+                scores = cosine_similarity_matrix(matrix[:1], matrix[1:])[0]
+                return [(float(s) >= threshold, float(s)) for s in scores]
+
+            # Fallback: simple word overlap per candidate
+            return [
+                (overlap > 0.3, overlap)
+                for overlap in (
+                    self._word_overlap(query, candidate) for candidate in candidates
+                )
+            ]
+
+        try:
+            embeddings = await self.openai_embeddings.aembed_documents(
+                [query, *candidates]
+            )
+            matrix = np.asarray(embeddings, dtype=np.float32)
+            scores = cosine_similarity_matrix(matrix[:1], matrix[1:])[0]
+            return [(float(s) >= threshold, float(s)) for s in scores]
+
+        except Exception as e:
+            logger.error(f"Batch embedding similarity check error: {e}")
+            return [
+                (overlap > 0.3, overlap)
+                for overlap in (
+                    self._word_overlap(query, candidate) for candidate in candidates
+                )
+            ]
+
     async def generate_svg(self, request: SVGGenerationRequest) -> SVGGenerationResponse:
         """
         Generate an SVG visualization from text description using LangChain.
@@ -325,6 +1014,38 @@ class LLMProcessor:
             logger.warning("No LLM model available, returning mock response")
             return await self._generate_mock_svg(request)
 
+        # check the exact-match response cache before hitting the LLM
+        cache_key = self._cache_key(request)
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"[SVG_LLM] Response cache hit for: {request.text[:50]}...")
+            return cached
+
+        # exact-match miss: try the semantic cache for paraphrased prompts
+        prompt_embedding = None
+        if not request.style and not request.context:
+            prompt_embedding = await self._embed_prompt(request.text)
+            if prompt_embedding is not None:
+                semantic_hit = _semantic_cache_lookup(prompt_embedding)
+                if semantic_hit is not None:
+                    logger.info(
+                        f"[SVG_LLM] Semantic cache hit for: {request.text[:50]}..."
+                    )
+                    return semantic_hit
+
+        # coalesce concurrent duplicates: a second caller for the same key
+        # awaits the first caller's future instead of firing another LLM call
+        inflight = _INFLIGHT.get(cache_key)
+        if inflight is not None:
+            logger.info(f"[SVG_LLM] Joining in-flight generation for: {request.text[:50]}...")
+            return await asyncio.shield(inflight)
+
+        future: "asyncio.Future[SVGGenerationResponse]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        _INFLIGHT[cache_key] = future
+        svg_response: Optional[SVGGenerationResponse] = None
+
         try:
             # Build prompt
             prompt_parts = [f"Create a detailed SVG visualization for: {request.text}"]
@@ -336,7 +1057,7 @@ class LLMProcessor:
 
             # Create messages
             messages = [
-                SystemMessage(content=SVG_SYSTEM_PROMPT),
+                _SVG_SYSTEM_MESSAGE,
                 HumanMessage(content=user_prompt),
             ]
 
@@ -344,27 +1065,105 @@ class LLMProcessor:
             logger.info(f"[SVG_LLM] ========== SVG GENERATION START ==========")
             logger.info(f"[SVG_LLM] Model: {model}")
             logger.info(f"[SVG_LLM] Prompt: {user_prompt}")
-            response = await model.ainvoke(messages)
+
+            # speculative routing: simple prompts rarely need the full-size
+            # model, so draft with the cheaper one and escalate only when
+            # the draft fails SVG validation
+            complexity = (
+                len(request.text.split())
+                + (20 if request.context else 0)
+                + (10 if request.style else 0)
+            )
+            draft_model = None
+            if (
+                complexity < 40
+                and self.openai_model is not None
+                and model is not self.openai_model
+            ):
+                draft_model = self.openai_model
+
+            if draft_model is not None:
+                logger.info(f"[SVG_LLM] Drafting with cheaper model (complexity={complexity})")
+                response = await draft_model.ainvoke(messages)
+                svg_code = self._extract_svg(response.content)
+                if not svg_code.strip().startswith("<svg") or len(svg_code) < 100:
+                    logger.info("[SVG_LLM] Draft rejected, escalating to primary model")
+                    response = await model.ainvoke(messages)
+                    svg_code = self._extract_svg(response.content)
+            else:
+                response = await model.ainvoke(messages)
+                svg_code = self._extract_svg(response.content)
+
             logger.info(f"[SVG_LLM] ========== FULL RESPONSE ==========")
             logger.info(f"[SVG_LLM] Response content:\n{response.content}")
             logger.info(f"[SVG_LLM] ========== END RESPONSE ==========")
-            svg_code = self._extract_svg(response.content)
             logger.info(f"[SVG_LLM] Extracted SVG length: {len(svg_code)}, starts with <svg: {svg_code.strip().startswith('<svg')}")
 
-            return SVGGenerationResponse(
+            svg_response = SVGGenerationResponse(
                 svg_code=svg_code,
                 description=f"Visualization generated for: {request.text}",
                 original_text=request.text,
+                usage=self._extract_usage(response),
             )
+            _response_cache_put(cache_key, svg_response)
+            if prompt_embedding is not None:
+                _semantic_cache_add(prompt_embedding, svg_response)
 
         except Exception as e:
             logger.error(f"SVG generation error: {e}", exc_info=True)
-            return SVGGenerationResponse(
+            svg_response = SVGGenerationResponse(
                 svg_code=self._create_fallback_svg(request.text, str(e)),
                 description=f"Error generating visualization: {e}",
                 original_text=request.text,
             )
 
+        finally:
+            _INFLIGHT.pop(cache_key, None)
+            if not future.done():
+                if svg_response is not None:
+                    # waiters get the same response (or fallback) we return
+                    future.set_result(svg_response)
+                else:
+                    # generation was cancelled before producing a response
+                    future.cancel()
+
+        return svg_response
+
+    async def generate_svg_batched(self, request: SVGGenerationRequest) -> SVGGenerationResponse:
+        """
+        Generate an SVG through the shared micro-batcher.
+        Requests arriving within a ~20ms window are folded into a single
+        LLM call; a lone request behaves like generate_svg.
+
+        Args:
+            request: SVG generation request with text and options
+
+        Returns:
+            SVG generation response containing the SVG code and metadata
+        """
+        return await _svg_batcher.submit(self, request)
+
+    async def generate_svg_many(
+        self, requests: list[SVGGenerationRequest]
+    ) -> list[SVGGenerationResponse]:
+        """
+        Generate SVGs for several requests concurrently.
+        All requests are issued at once via asyncio.gather, so total latency
+        tracks the slowest generation instead of the sum; each one still
+        benefits from the response caches and in-flight deduplication.
+
+        Args:
+            requests: SVG generation requests to process in parallel
+
+        Returns:
+            SVG generation responses in the same order as the requests
+        """
+        if not requests:
+            return []
+        return list(await asyncio.gather(
+            *(self.generate_svg(request) for request in requests)
+        ))
+
     async def generate_enhanced_svg(
         self,
         previous_text: str,
@@ -413,7 +1212,7 @@ Instructions:
                 prompt += f"\nStyle preferences: {style}"
 
             messages = [
-                SystemMessage(content=SVG_SYSTEM_PROMPT),
+                _SVG_SYSTEM_MESSAGE,
                 HumanMessage(content=prompt),
             ]
 
@@ -427,6 +1226,7 @@ Instructions:
                 svg_code=svg_code,
                 description=f"Enhanced visualization: {new_text}",
                 original_text=combined_text,
+                usage=self._extract_usage(response),
             )
 
         except Exception as e:
@@ -439,22 +1239,12 @@ Instructions:
 
     def _strip_attribution_phrases(self, text: str) -> str:
         """Remove narration/speaker-attribution phrasing from summary lines."""
-        attribution_patterns = [
-            r"\b(the )?(user|speaker|presenter)\s+"
-            r"(stated|states|said|says|mentioned|mentions|noted|notes|"
-            r"described|describes|explained|explains|shared|shares)( that)?\b",
-            r"\baccording to (the )?(user|speaker|presenter|transcript)\b[:,]?",
-            r"\b(the )?transcript\s+(stated|states|said|says|shows|indicates)( that)?\b",
-            r"\bit was (stated|said|mentioned|noted|described|explained) that\b",
-            r"\bfrom (the )?(user|speaker|transcript)\b[:,]?",
-        ]
-
         normalized = text
-        for pattern in attribution_patterns:
-            normalized = re.sub(pattern, "", normalized, flags=re.IGNORECASE)
+        for pattern in _ATTRIBUTION_RES:
+            normalized = pattern.sub("", normalized)
 
-        normalized = re.sub(r"^\s*(that|about|regarding)\s+", "", normalized, flags=re.IGNORECASE)
-        normalized = re.sub(r"\s+", " ", normalized).strip(" -:;,")
+        normalized = _LEADING_FILLER_RE.sub("", normalized)
+        normalized = _WHITESPACE_RE.sub(" ", normalized).strip(" -:;,")
         return normalized
 
     def _format_structured_slide_summary(self, bullets: list[str]) -> str:
@@ -464,7 +1254,7 @@ Instructions:
 
         for bullet in bullets:
             cleaned = self._strip_attribution_phrases(bullet)
-            cleaned = re.sub(r"^[#>\-*]+", "", cleaned).strip()
+            cleaned = _LEADING_MARKUP_RE.sub("", cleaned).strip()
             if not cleaned:
                 continue
             key = cleaned.lower()
@@ -511,22 +1301,17 @@ Instructions:
         if not lines:
             return fallback
 
-        bullet_pattern = re.compile(r"^([*-]|\u2022|\d+[.)])\s+")
-        heading_pattern = re.compile(
-            r"^(#{1,6}\s*)?(key concepts?|key details?|takeaways?|summary|main ideas?)\s*:?\s*$",
-            re.IGNORECASE,
-        )
         normalized_bullets: list[str] = []
 
         for line in lines:
-            if heading_pattern.match(line):
+            if _HEADING_RE.match(line):
                 continue
 
-            line_match = bullet_pattern.match(line)
+            line_match = _BULLET_RE.match(line)
             if line_match:
                 normalized_bullets.append(line[line_match.end():])
             else:
-                candidates = re.split(r"(?<=[.!?])\s+", line)
+                candidates = _SENTENCE_SPLIT_RE.split(line)
                 for candidate in candidates:
                     cleaned_candidate = self._strip_attribution_phrases(candidate)
                     if cleaned_candidate:
@@ -546,7 +1331,7 @@ Instructions:
             )
 
         recent_text = " ".join(cleaned[-5:])
-        sentence_candidates = re.split(r"(?<=[.!?])\s+", recent_text)
+        sentence_candidates = _SENTENCE_SPLIT_RE.split(recent_text)
         bullets = [
             self._strip_attribution_phrases(sentence.strip())
             for sentence in sentence_candidates
@@ -558,6 +1343,88 @@ Instructions:
 
         return self._format_structured_slide_summary(bullets)
 
+    def _build_summary_prompt(self, cleaned: list[str]) -> str:
+        """Build the slide-notes summary prompt from cleaned transcript lines."""
+        snippets = cleaned[:40]
+        formatted_text = "\n".join(
+            f"{idx}. {snippet[:700]}" for idx, snippet in enumerate(snippets, 1)
+        )
+        return (
+            "Convert this live transcript into educational slide notes.\n"
+            "Use exactly these sections: Key Concepts, Key Details, Takeaways.\n"
+            "Under each section, return concise bullets only.\n"
+            "Do not use speaker-attribution wording.\n\n"
+            f"{formatted_text}"
+        )
+
+    async def _generate_summary_via_batch(self, texts: list[str]) -> Optional[str]:
+        """
+        Run a summary through the OpenAI Batch API.
+        Batch jobs are billed at the discounted async tier, at the cost of
+        queueing latency, so this only suits non-urgent summaries. Returns
+        the raw summary text, or None if the batch path is unavailable,
+        fails, or does not finish within the polling budget.
+        """
+        if not settings.openai_api_key:
+            return None
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            return None
+
+        cleaned = [text.strip() for text in texts if text and text.strip()]
+        if not cleaned:
+            return None
+
+        try:
+            client = AsyncOpenAI(api_key=settings.openai_api_key)
+            request_line = {
+                "custom_id": "summary-0",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4o-mini",
+                    "max_tokens": 320,
+                    "temperature": 0.2,
+                    "messages": [
+                        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                        {"role": "user", "content": self._build_summary_prompt(cleaned)},
+                    ],
+                },
+            }
+            batch_file = await client.files.create(
+                file=("summary_batch.jsonl", json.dumps(request_line).encode()),
+                purpose="batch",
+            )
+            batch = await client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+
+            deadline = time.monotonic() + _SUMMARY_BATCH_TIMEOUT_S
+            while time.monotonic() < deadline:
+                if batch.status == "completed":
+                    break
+                if batch.status in ("failed", "expired", "cancelled"):
+                    logger.warning(f"Summary batch {batch.id} ended as {batch.status}")
+                    return None
+                await asyncio.sleep(_SUMMARY_BATCH_POLL_S)
+                batch = await client.batches.retrieve(batch.id)
+            else:
+                logger.warning(f"Summary batch {batch.id} timed out; falling back")
+                return None
+
+            if not batch.output_file_id:
+                return None
+            output = await client.files.content(batch.output_file_id)
+            result = json.loads(output.text.splitlines()[0])
+            return result["response"]["body"]["choices"][0]["message"]["content"]
+
+        except Exception as e:
+            logger.error(f"OpenAI batch summary error: {e}")
+            return None
+
     async def generate_brief_summary_with_debug(self, texts: list[str]) -> dict[str, Any]:
         """
         Generate a concise live summary using LangChain with debug metadata.
@@ -577,20 +1444,10 @@ Instructions:
                 "elapsed_ms": 0,
             }
 
-        snippets = cleaned[:40]
-        formatted_text = "\n".join(
-            f"{idx + 1}. {snippet[:700]}" for idx, snippet in enumerate(snippets)
-        )
-        prompt = (
-            "Convert this live transcript into educational slide notes.\n"
-            "Use exactly these sections: Key Concepts, Key Details, Takeaways.\n"
-            "Under each section, return concise bullets only.\n"
-            "Do not use speaker-attribution wording.\n\n"
-            f"{formatted_text}"
-        )
+        prompt = self._build_summary_prompt(cleaned)
 
         messages = [
-            SystemMessage(content=SUMMARY_SYSTEM_PROMPT),
+            _SUMMARY_SYSTEM_MESSAGE,
             HumanMessage(content=prompt),
         ]
 
@@ -599,7 +1456,6 @@ Instructions:
             started = time.perf_counter()
             try:
                 # Use a faster model for summaries
-                from langchain_anthropic import ChatAnthropic
                 summary_model = ChatAnthropic(
                     model=settings.summary_llm_model,
                     api_key=settings.claude_key,
@@ -627,7 +1483,6 @@ Instructions:
         if self.openai_model:
             started = time.perf_counter()
             try:
-                from langchain_openai import ChatOpenAI
                 summary_model = ChatOpenAI(
                     model="gpt-4o-mini",
                     api_key=settings.openai_api_key,
@@ -662,8 +1517,21 @@ Instructions:
             "elapsed_ms": 0,
         }
 
-    async def generate_brief_summary(self, texts: list[str]) -> str:
-        """Generate a short summary from user speech/text segments."""
+    async def generate_brief_summary(self, texts: list[str], urgent: bool = True) -> str:
+        """
+        Generate a short summary from user speech/text segments.
+        Non-urgent callers (urgent=False) are routed through the OpenAI
+        Batch API for the discounted async tier; the interactive path is
+        used whenever the batch path is unavailable or fails.
+        """
+        if not urgent:
+            batch_summary = await self._generate_summary_via_batch(texts)
+            if batch_summary is not None:
+                cleaned = [text.strip() for text in texts if text and text.strip()]
+                return self._normalize_summary(
+                    batch_summary, self._build_fallback_summary(cleaned)
+                )
+
         summary_payload = await self.generate_brief_summary_with_debug(texts)
         return str(summary_payload["summary"])
 
@@ -681,7 +1549,7 @@ Instructions:
 
         try:
             messages = [
-                SystemMessage(content=GRAMMAR_SYSTEM_PROMPT),
+                _GRAMMAR_SYSTEM_MESSAGE,
                 HumanMessage(content=text.strip()),
             ]
             response = await model.ainvoke(messages)
@@ -699,28 +1567,9 @@ Instructions:
 
     async def _generate_mock_svg(self, request: SVGGenerationRequest) -> SVGGenerationResponse:
         """Generate a mock SVG for testing without API access."""
-        escaped_text = request.text[:60].replace("<", "&lt;").replace(">", "&gt;")
-
-        mock_svg = f"""<svg viewBox="0 0 400 300" xmlns="http://www.w3.org/2000/svg">
-  <defs>
-    <linearGradient id="bgGradient" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#667eea;stop-opacity:1" />
-      <stop offset="100%" style="stop-color:#764ba2;stop-opacity:1" />
-    </linearGradient>
-  </defs>
-  <rect width="400" height="300" fill="url(#bgGradient)"/>
-  <circle cx="50" cy="50" r="30" fill="rgba(255,255,255,0.1)"/>
-  <circle cx="350" cy="250" r="50" fill="rgba(255,255,255,0.1)"/>
-  <text x="200" y="140" text-anchor="middle" font-family="system-ui" font-size="16" fill="white" font-weight="bold">
-    Mock Visualization
-  </text>
-  <text x="200" y="170" text-anchor="middle" font-family="system-ui" font-size="12" fill="rgba(255,255,255,0.8)">
-    {escaped_text}
-  </text>
-  <text x="200" y="270" text-anchor="middle" font-family="system-ui" font-size="10" fill="rgba(255,255,255,0.6)">
-    Configure API keys for real generation
-  </text>
-</svg>"""
+        # truncate first so escaping only ever runs on the display snippet
+        text_snippet = request.text[:60]
+        mock_svg = _MOCK_SVG_PREFIX + text_snippet.translate(_SVG_TEXT_ESCAPE) + _MOCK_SVG_SUFFIX
 
         return SVGGenerationResponse(
             svg_code=mock_svg,
@@ -745,16 +1594,61 @@ Instructions:
             user_prompt = "\n".join(prompt_parts)
 
             messages = [
-                SystemMessage(content=SVG_SYSTEM_PROMPT),
+                _SVG_SYSTEM_MESSAGE,
                 HumanMessage(content=user_prompt),
             ]
 
-            # Use LangChain streaming
+            # Gate the stream to the SVG payload: buffer until "<svg" shows
+            # up (dropping any model preamble or code fences), forward from
+            # there, and stop as soon as "</svg>" has been emitted so
+            # trailing chatter never reaches the client
+            buffer = ""
+            streaming_svg = False
             async for chunk in model.astream(messages):
-                if hasattr(chunk, 'content') and chunk.content:
-                    yield chunk.content
+                if not (hasattr(chunk, "content") and chunk.content):
+                    continue
+                content = self._get_text_content(chunk.content)
+                if not content:
+                    continue
+
+                buffer += content
+                if not streaming_svg:
+                    start = buffer.lower().find("<svg")
+                    if start == -1:
+                        # keep just enough tail to complete a split "<svg"
+                        buffer = buffer[-3:]
+                        continue
+                    buffer = buffer[start:]
+                    streaming_svg = True
+
+                end = buffer.lower().find("</svg>")
+                if end != -1:
+                    yield buffer[:end + 6]
+                    return
+
+                # hold back a short tail in case "</svg>" spans two chunks
+                if len(buffer) > 5:
+                    yield buffer[:-5]
+                    buffer = buffer[-5:]
+
+            # stream ended without a closing tag; flush what we have
+            if streaming_svg and buffer:
+                yield buffer
 
         except Exception as e:
             logger.error(f"Streaming generation error: {e}")
             fallback = self._create_fallback_svg(request.text, str(e))
             yield fallback
+
+    async def generate_svg_streaming_bytes(self, request: SVGGenerationRequest):
+        """
+        Generate SVG with streaming response, yielding pre-encoded bytes.
+        Encoding once here lets transport layers (ASGI/websocket) forward
+        chunks to the socket without a per-chunk UTF-8 encode of their own.
+        """
+        async for chunk in self.generate_svg_streaming(request):
+            if isinstance(chunk, str):
+                yield chunk.encode("utf-8")
+            else:
+                # mock path yields a full SVGGenerationResponse
+                yield chunk.svg_code.encode("utf-8")
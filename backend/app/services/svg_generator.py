@@ -12,6 +12,78 @@ from xml.etree import ElementTree as ET
 
 logger = logging.getLogger(__name__)
 
+# compiled once for the optimization pass
+_COMMENT_RE = re.compile(r"<!--[\s\S]*?-->")
+_WHITESPACE_RE = re.compile(r"\s+")
+_INTER_TAG_RE = re.compile(r">\s+<")
+_LONG_DECIMAL_RE = re.compile(r"\d+\.\d{4,}")
+_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def _round_decimal(match: "re.Match[str]") -> str:
+    """round an over-precise decimal literal to 3 digits."""
+    rounded = f"{float(match.group(0)):.3f}".rstrip("0").rstrip(".")
+    return rounded or "0"
+
+
+def _round_tag_decimals(match: "re.Match[str]") -> str:
+    """round over-precise decimals within a single markup tag."""
+    return _LONG_DECIMAL_RE.sub(_round_decimal, match.group(0))
+
+
+# single-pass escape table for user text embedded in generated svgs
+_TEXT_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# the placeholder and error svgs are static except for their message slot,
+# so each template is split once at import; building one is then a single
+# concatenation instead of re-evaluating a ~1KB f-string per call
+_PLACEHOLDER_SVG_PREFIX = """<svg viewBox="0 0 400 300" xmlns="http://www.w3.org/2000/svg" width="100%" height="100%">
+  <!-- placeholder svg shown during loading -->
+  <rect width="400" height="300" fill="#f8f9fa"/>
+
+  <!-- loading animation circles -->
+  <g transform="translate(200, 130)">
+    <circle cx="-30" cy="0" r="8" fill="#6c757d">
+      <animate attributeName="opacity" values="1;0.3;1" dur="1s" repeatCount="indefinite" begin="0s"/>
+    </circle>
+    <circle cx="0" cy="0" r="8" fill="#6c757d">
+      <animate attributeName="opacity" values="1;0.3;1" dur="1s" repeatCount="indefinite" begin="0.2s"/>
+    </circle>
+    <circle cx="30" cy="0" r="8" fill="#6c757d">
+      <animate attributeName="opacity" values="1;0.3;1" dur="1s" repeatCount="indefinite" begin="0.4s"/>
+    </circle>
+  </g>
+
+  <!-- loading message -->
+  <text x="200" y="180" text-anchor="middle" font-family="system-ui" font-size="14" fill="#6c757d">
+    """
+
+_PLACEHOLDER_SVG_SUFFIX = """
+  </text>
+</svg>"""
+
+_ERROR_SVG_PREFIX = """<svg viewBox="0 0 400 300" xmlns="http://www.w3.org/2000/svg" width="100%" height="100%">
+  <!-- error state svg -->
+  <rect width="400" height="300" fill="#fff5f5" stroke="#fed7d7" stroke-width="2"/>
+
+  <!-- error icon -->
+  <g transform="translate(200, 100)">
+    <circle cx="0" cy="0" r="30" fill="none" stroke="#e53e3e" stroke-width="3"/>
+    <line x1="0" y1="-15" x2="0" y2="5" stroke="#e53e3e" stroke-width="3" stroke-linecap="round"/>
+    <circle cx="0" cy="15" r="3" fill="#e53e3e"/>
+  </g>
+
+  <!-- error message -->
+  <text x="200" y="170" text-anchor="middle" font-family="system-ui" font-size="16" fill="#c53030" font-weight="bold">
+    generation failed
+  </text>
+  <text x="200" y="195" text-anchor="middle" font-family="system-ui" font-size="12" fill="#742a2a">
+    """
+
+_ERROR_SVG_SUFFIX = """
+  </text>
+</svg>"""
+
 
 class SVGValidationError(Exception):
     """raised when svg validation fails."""
@@ -106,14 +178,19 @@ class SVGGenerator:
         returns:
             optimized svg code
         """
-        # remove xml comments (but keep svg comments for debugging)
-        # we keep comments that might be useful for understanding the visualization
+        # strip comments entirely - they are dead weight on the wire
+        svg_code = _COMMENT_RE.sub("", svg_code)
 
         # collapse multiple whitespace into single space
-        svg_code = re.sub(r"\s+", " ", svg_code)
+        svg_code = _WHITESPACE_RE.sub(" ", svg_code)
 
         # remove whitespace between tags
-        svg_code = re.sub(r">\s+<", "><", svg_code)
+        svg_code = _INTER_TAG_RE.sub("><", svg_code)
+
+        # round over-precise coordinates (llms love emitting 6+ decimals).
+        # only inside tags: attribute values and path data are coordinates,
+        # while numbers in text-node content are user-visible and kept exact
+        svg_code = _TAG_RE.sub(_round_tag_decimals, svg_code)
 
         # trim leading and trailing whitespace
         svg_code = svg_code.strip()
@@ -149,6 +226,99 @@ class SVGGenerator:
 
         return svg_code
 
+    def tighten_viewbox(self, svg_code: str, padding: float = 10.0) -> str:
+        """
+        shrink the viewbox to the bounding box of the actual content.
+        llm output frequently clusters shapes in a subregion of the
+        requested canvas, leaving empty coordinate space the browser
+        still has to consider. text extents are approximated by their
+        anchor point, so a small padding is kept around the box.
+
+        args:
+            svg_code: svg code to analyze
+            padding: extra space to keep around the content box
+
+        returns:
+            svg code with a minimal viewbox, or the input unchanged
+            when no measurable shapes are found
+        """
+        try:
+            root = ET.fromstring(svg_code)
+        except ET.ParseError:
+            return svg_code
+
+        min_x = min_y = float("inf")
+        max_x = max_y = float("-inf")
+
+        def _num(element, name: str, default: float = 0.0) -> float:
+            try:
+                return float(element.get(name, default))
+            except (TypeError, ValueError):
+                return default
+
+        def _include(x: float, y: float):
+            nonlocal min_x, min_y, max_x, max_y
+            min_x = min(min_x, x)
+            min_y = min(min_y, y)
+            max_x = max(max_x, x)
+            max_y = max(max_y, y)
+
+        for element in root.iter():
+            tag = element.tag.rsplit("}", 1)[-1].lower()
+
+            if tag == "rect":
+                x, y = _num(element, "x"), _num(element, "y")
+                _include(x, y)
+                _include(x + _num(element, "width"), y + _num(element, "height"))
+            elif tag == "circle":
+                cx, cy, r = _num(element, "cx"), _num(element, "cy"), _num(element, "r")
+                _include(cx - r, cy - r)
+                _include(cx + r, cy + r)
+            elif tag == "ellipse":
+                cx, cy = _num(element, "cx"), _num(element, "cy")
+                rx, ry = _num(element, "rx"), _num(element, "ry")
+                _include(cx - rx, cy - ry)
+                _include(cx + rx, cy + ry)
+            elif tag == "line":
+                _include(_num(element, "x1"), _num(element, "y1"))
+                _include(_num(element, "x2"), _num(element, "y2"))
+            elif tag in ("polygon", "polyline"):
+                coords = re.findall(r"-?\d+(?:\.\d+)?", element.get("points", ""))
+                for i in range(0, len(coords) - 1, 2):
+                    _include(float(coords[i]), float(coords[i + 1]))
+            elif tag == "path":
+                # approximate: treat every numeric pair in the path data
+                # as a coordinate, which overestimates for arc flags but
+                # never underestimates the box
+                coords = re.findall(r"-?\d+(?:\.\d+)?", element.get("d", ""))
+                for i in range(0, len(coords) - 1, 2):
+                    _include(float(coords[i]), float(coords[i + 1]))
+            elif tag == "text":
+                _include(_num(element, "x"), _num(element, "y"))
+
+        if min_x > max_x or min_y > max_y:
+            return svg_code
+
+        box_x = min_x - padding
+        box_y = min_y - padding
+        box_w = (max_x - min_x) + 2 * padding
+        box_h = (max_y - min_y) + 2 * padding
+
+        if box_w <= 0 or box_h <= 0:
+            return svg_code
+
+        new_viewbox = f"{box_x:g} {box_y:g} {box_w:g} {box_h:g}"
+
+        if re.search(r'viewBox\s*=', svg_code, re.IGNORECASE):
+            return re.sub(
+                r'viewBox\s*=\s*["\'][^"\']*["\']',
+                f'viewBox="{new_viewbox}"',
+                svg_code,
+                count=1,
+                flags=re.IGNORECASE,
+            )
+        return self.add_viewbox(svg_code, new_viewbox)
+
     def add_responsive_attributes(self, svg_code: str) -> str:
         """
         add attributes to make the svg responsive.
@@ -181,6 +351,7 @@ class SVGGenerator:
         sanitize: bool = True,
         optimize: bool = False,
         responsive: bool = True,
+        tighten: bool = False,
     ) -> str:
         """
         apply a pipeline of processing steps to svg code.
@@ -191,6 +362,7 @@ class SVGGenerator:
             sanitize: whether to sanitize for security
             optimize: whether to optimize for size
             responsive: whether to add responsive attributes
+            tighten: whether to shrink the viewbox to the content bounds
 
         returns:
             processed svg code
@@ -200,6 +372,9 @@ class SVGGenerator:
 
         svg_code = self.add_viewbox(svg_code)
 
+        if tighten:
+            svg_code = self.tighten_viewbox(svg_code)
+
         if responsive:
             svg_code = self.add_responsive_attributes(svg_code)
 
@@ -221,30 +396,13 @@ class SVGGenerator:
         returns:
             placeholder svg code
         """
-        escaped_message = message.replace("<", "&lt;").replace(">", "&gt;")
+        escaped_message = message.translate(_TEXT_ESCAPE)
 
-        return f"""<svg viewBox="0 0 400 300" xmlns="http://www.w3.org/2000/svg" width="100%" height="100%">
-  <!-- placeholder svg shown during loading -->
-  <rect width="400" height="300" fill="#f8f9fa"/>
-
-  <!-- loading animation circles -->
-  <g transform="translate(200, 130)">
-    <circle cx="-30" cy="0" r="8" fill="#6c757d">
-      <animate attributeName="opacity" values="1;0.3;1" dur="1s" repeatCount="indefinite" begin="0s"/>
-    </circle>
-    <circle cx="0" cy="0" r="8" fill="#6c757d">
-      <animate attributeName="opacity" values="1;0.3;1" dur="1s" repeatCount="indefinite" begin="0.2s"/>
-    </circle>
-    <circle cx="30" cy="0" r="8" fill="#6c757d">
-      <animate attributeName="opacity" values="1;0.3;1" dur="1s" repeatCount="indefinite" begin="0.4s"/>
-    </circle>
-  </g>
-
-  <!-- loading message -->
-  <text x="200" y="180" text-anchor="middle" font-family="system-ui" font-size="14" fill="#6c757d">
-    {escaped_message}
-  </text>
-</svg>"""
+        return "".join((
+            _PLACEHOLDER_SVG_PREFIX,
+            escaped_message,
+            _PLACEHOLDER_SVG_SUFFIX,
+        ))
 
     def create_error_svg(self, error_message: str) -> str:
         """
@@ -257,27 +415,13 @@ class SVGGenerator:
         returns:
             error svg code
         """
-        escaped_error = error_message[:100].replace("<", "&lt;").replace(">", "&gt;")
-
-        return f"""<svg viewBox="0 0 400 300" xmlns="http://www.w3.org/2000/svg" width="100%" height="100%">
-  <!-- error state svg -->
-  <rect width="400" height="300" fill="#fff5f5" stroke="#fed7d7" stroke-width="2"/>
-
-  <!-- error icon -->
-  <g transform="translate(200, 100)">
-    <circle cx="0" cy="0" r="30" fill="none" stroke="#e53e3e" stroke-width="3"/>
-    <line x1="0" y1="-15" x2="0" y2="5" stroke="#e53e3e" stroke-width="3" stroke-linecap="round"/>
-    <circle cx="0" cy="15" r="3" fill="#e53e3e"/>
-  </g>
+        escaped_error = error_message[:100].translate(_TEXT_ESCAPE)
 
-  <!-- error message -->
-  <text x="200" y="170" text-anchor="middle" font-family="system-ui" font-size="16" fill="#c53030" font-weight="bold">
-    generation failed
-  </text>
-  <text x="200" y="195" text-anchor="middle" font-family="system-ui" font-size="12" fill="#742a2a">
-    {escaped_error}
-  </text>
-</svg>"""
+        return "".join((
+            _ERROR_SVG_PREFIX,
+            escaped_error,
+            _ERROR_SVG_SUFFIX,
+        ))
 
     def wrap_svg_for_animation(self, svg_code: str, animation_type: str = "fade") -> str:
         """
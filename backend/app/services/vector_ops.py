@@ -0,0 +1,78 @@
+"""
+Vector math helpers for embedding similarity.
+Provides batched cosine similarity with an optional Numba-compiled kernel
+(parallel, fastmath) for CPU-bound scoring of one query against many
+candidates; falls back to a plain NumPy matrix product when numba is not
+installed.
+"""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _cosine_matrix_numba(a, b):  # pragma: no cover - compiled path
+        m = a.shape[0]
+        n = b.shape[0]
+        d = a.shape[1]
+        out = np.zeros((m, n), dtype=np.float32)
+
+        b_norms = np.zeros(n, dtype=np.float32)
+        for j in range(n):
+            acc = 0.0
+            for k in range(d):
+                acc += b[j, k] * b[j, k]
+            b_norms[j] = np.sqrt(acc)
+
+        for i in prange(m):
+            acc = 0.0
+            for k in range(d):
+                acc += a[i, k] * a[i, k]
+            a_norm = np.sqrt(acc)
+            if a_norm == 0.0:
+                continue
+            for j in range(n):
+                if b_norms[j] == 0.0:
+                    continue
+                dot = 0.0
+                for k in range(d):
+                    dot += a[i, k] * b[j, k]
+                out[i, j] = dot / (a_norm * b_norms[j])
+        return out
+
+
+def cosine_similarity_matrix(a, b) -> np.ndarray:
+    """
+    Compute cosine similarity between every row of a and every row of b.
+
+    Args:
+        a: array-like of shape (m, d)
+        b: array-like of shape (n, d)
+
+    Returns:
+        float32 array of shape (m, n); rows with zero magnitude score 0.0
+    """
+    a = np.ascontiguousarray(a, dtype=np.float32)
+    b = np.ascontiguousarray(b, dtype=np.float32)
+
+    if _NUMBA_AVAILABLE:
+        return _cosine_matrix_numba(a, b)
+
+    # NumPy fallback: normalize rows (zero rows map to 0 via inf norms),
+    # then one matrix product
+    a_norms = np.linalg.norm(a, axis=1, keepdims=True)
+    b_norms = np.linalg.norm(b, axis=1, keepdims=True)
+    a_norms[a_norms == 0] = np.inf
+    b_norms[b_norms == 0] = np.inf
+    return ((a / a_norms) @ (b / b_norms).T).astype(np.float32)
@@ -0,0 +1,53 @@
+"""
+optional numba-compiled pcm kernels.
+parallel (prange, fastmath) versions of the linear-interpolation resample
+and peak-normalize loops for large offline files, where the numpy path is
+vectorized but single-threaded. importing this module never requires
+numba: NUMBA_AVAILABLE tells callers whether the kernels exist.
+"""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def resample_i16(samples, ratio):  # pragma: no cover - compiled path
+        """linear-interpolation resample of int16 samples by ratio."""
+        num_samples = samples.shape[0]
+        new_n = int(num_samples * ratio)
+        out = np.empty(new_n, dtype=np.int16)
+        last = num_samples - 1
+        for i in prange(new_n):
+            pos = i / ratio
+            idx = int(pos)
+            frac = pos - idx
+            nxt = idx + 1
+            if nxt > last:
+                nxt = last
+            out[i] = np.int16(samples[idx] * (1.0 - frac) + samples[nxt] * frac)
+        return out
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def normalize_i16(samples, scale):  # pragma: no cover - compiled path
+        """scale int16 samples by a factor, clamping to the int16 range."""
+        n = samples.shape[0]
+        out = np.empty(n, dtype=np.int16)
+        for i in prange(n):
+            value = samples[i] * scale
+            if value > 32767.0:
+                value = 32767.0
+            elif value < -32768.0:
+                value = -32768.0
+            out[i] = np.int16(value)
+        return out
@@ -4,14 +4,27 @@ handles audio format conversion, validation, and processing
 for use with speech-to-text services.
 """
 
-import io
+import asyncio
+import math
 import struct
 import logging
 from enum import Enum
 from typing import Optional
 
+import numpy as np
+
+from app.utils import audio_numba
+
 logger = logging.getLogger(__name__)
 
+# below this size the numpy pass is already fast enough that numba's call
+# overhead is not worth paying; above it the parallel kernels win
+_NUMBA_MIN_BYTES = 32 * 1024
+
+# precompiled struct for the wav header size fields; struct.Struct amortizes
+# the format-string parse that struct.pack_into would redo on every call
+_UINT32 = struct.Struct("<I")
+
 
 class AudioFormat(Enum):
     """supported audio formats for processing."""
@@ -47,6 +60,28 @@ class AudioProcessor:
         self.channels = channels
         self.bits_per_sample = bits_per_sample
         self.bytes_per_sample = bits_per_sample // 8
+        self.bytes_per_second = sample_rate * channels * self.bytes_per_sample
+
+        # everything in the 44-byte wav header except the two size fields
+        # is fixed by the constructor parameters, so the header is packed
+        # once here; create_wav_header then just patches the sizes in
+        block_align = self.channels * self.bytes_per_sample
+        self._wav_header_template = bytearray(struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",  # chunk id
+            0,  # chunk size (patched per call)
+            b"WAVE",  # format
+            b"fmt ",  # subchunk1 id
+            16,  # subchunk1 size (16 for pcm)
+            1,  # audio format (1 = pcm)
+            self.channels,  # number of channels
+            self.sample_rate,  # sample rate
+            self.bytes_per_second,  # byte rate
+            block_align,  # block align
+            self.bits_per_sample,  # bits per sample
+            b"data",  # subchunk2 id
+            0,  # subchunk2 size (patched per call)
+        ))
 
     def create_wav_header(self, data_size: int) -> bytes:
         """
@@ -59,33 +94,17 @@ class AudioProcessor:
         returns:
             44-byte wav header
         """
-        byte_rate = self.sample_rate * self.channels * self.bytes_per_sample
-        block_align = self.channels * self.bytes_per_sample
-
         # wav file structure:
         # - riff chunk descriptor (12 bytes)
         # - fmt sub-chunk (24 bytes)
         # - data sub-chunk header (8 bytes)
         # total: 44 bytes
 
-        header = struct.pack(
-            "<4sI4s4sIHHIIHH4sI",
-            b"RIFF",  # chunk id
-            36 + data_size,  # chunk size
-            b"WAVE",  # format
-            b"fmt ",  # subchunk1 id
-            16,  # subchunk1 size (16 for pcm)
-            1,  # audio format (1 = pcm)
-            self.channels,  # number of channels
-            self.sample_rate,  # sample rate
-            byte_rate,  # byte rate
-            block_align,  # block align
-            self.bits_per_sample,  # bits per sample
-            b"data",  # subchunk2 id
-            data_size,  # subchunk2 size
-        )
-
-        return header
+        # copy the prebuilt template and patch the two size fields
+        header = bytearray(self._wav_header_template)
+        _UINT32.pack_into(header, 4, 36 + data_size)  # riff chunk size
+        _UINT32.pack_into(header, 40, data_size)  # data subchunk size
+        return bytes(header)
 
     def pcm_to_wav(self, pcm_data: bytes) -> bytes:
         """
@@ -132,8 +151,7 @@ class AudioProcessor:
         returns:
             duration in seconds
         """
-        bytes_per_second = self.sample_rate * self.channels * self.bytes_per_sample
-        return len(audio_bytes) / bytes_per_second
+        return len(audio_bytes) / self.bytes_per_second
 
     def resample(
         self, audio_data: bytes, target_sample_rate: int
@@ -153,32 +171,31 @@ class AudioProcessor:
         if target_sample_rate == self.sample_rate:
             return audio_data
 
-        # convert bytes to samples
-        num_samples = len(audio_data) // self.bytes_per_sample
-        samples = struct.unpack(f"<{num_samples}h", audio_data)
+        # view the pcm bytes as int16 samples without copying
+        samples = np.frombuffer(audio_data, dtype="<i2")
+        num_samples = samples.size
+        if num_samples == 0:
+            return audio_data
 
         # calculate resampling ratio
         ratio = target_sample_rate / self.sample_rate
-        new_num_samples = int(num_samples * ratio)
 
-        # simple linear interpolation resampling
-        resampled = []
-        for i in range(new_num_samples):
-            # find corresponding position in original samples
-            pos = i / ratio
-            idx = int(pos)
-            frac = pos - idx
+        # large offline buffers go through the parallel numba kernel when
+        # it is available; small streaming chunks stay on the numpy path
+        if audio_numba.NUMBA_AVAILABLE and len(audio_data) > _NUMBA_MIN_BYTES:
+            return audio_numba.resample_i16(samples, ratio).tobytes()
 
-            if idx + 1 < num_samples:
-                # interpolate between two samples
-                sample = int(samples[idx] * (1 - frac) + samples[idx + 1] * frac)
-            else:
-                sample = samples[idx] if idx < num_samples else 0
+        new_num_samples = int(num_samples * ratio)
 
-            resampled.append(sample)
+        # vectorized linear interpolation: compute every output position at
+        # once instead of looping sample by sample in python
+        pos = np.arange(new_num_samples, dtype=np.float64) / ratio
+        idx = pos.astype(np.int64)
+        frac = pos - idx
+        next_idx = np.minimum(idx + 1, num_samples - 1)
 
-        # convert back to bytes
-        return struct.pack(f"<{len(resampled)}h", *resampled)
+        resampled = samples[idx] * (1.0 - frac) + samples[next_idx] * frac
+        return resampled.astype("<i2").tobytes()
 
     def normalize_audio(
         self, audio_data: bytes, target_level: float = 0.9
@@ -194,13 +211,14 @@ class AudioProcessor:
         returns:
             normalized audio bytes
         """
-        # convert bytes to samples
-        num_samples = len(audio_data) // self.bytes_per_sample
-        samples = list(struct.unpack(f"<{num_samples}h", audio_data))
+        # view the pcm bytes as int16 samples, upcast once to float32
+        raw = np.frombuffer(audio_data, dtype="<i2")
+        samples = raw.astype(np.float32)
+        if samples.size == 0:
+            return audio_data
 
         # find peak amplitude
-        max_amplitude = max(abs(min(samples)), abs(max(samples)))
-
+        max_amplitude = float(np.abs(samples).max())
         if max_amplitude == 0:
             return audio_data
 
@@ -209,13 +227,16 @@ class AudioProcessor:
         target_amplitude = max_possible * target_level
         scale = target_amplitude / max_amplitude
 
-        # scale samples
-        normalized = [int(sample * scale) for sample in samples]
+        # large offline buffers go through the parallel numba kernel when
+        # it is available; small streaming chunks stay on the numpy path
+        if audio_numba.NUMBA_AVAILABLE and len(audio_data) > _NUMBA_MIN_BYTES:
+            return audio_numba.normalize_i16(raw, scale).tobytes()
 
-        # clamp values to prevent overflow
-        normalized = [max(-32768, min(32767, s)) for s in normalized]
+        # scale in place, then clamp to prevent overflow
+        samples *= scale
+        np.clip(samples, -32768, 32767, out=samples)
 
-        return struct.pack(f"<{len(normalized)}h", *normalized)
+        return samples.astype("<i2").tobytes()
 
     def detect_silence(
         self,
@@ -238,20 +259,70 @@ class AudioProcessor:
         if self.calculate_duration(audio_data) < min_duration:
             return False
 
-        # convert bytes to samples
-        num_samples = len(audio_data) // self.bytes_per_sample
-        samples = struct.unpack(f"<{num_samples}h", audio_data)
-
-        # calculate rms amplitude
-        rms = (sum(s ** 2 for s in samples) / num_samples) ** 0.5
+        # view the pcm bytes as int16 samples; square in int32 so the sum
+        # cannot overflow, then take one vectorized mean
+        samples = np.frombuffer(audio_data, dtype="<i2").astype(np.int32)
+        if samples.size == 0:
+            return True
 
+        rms = float(np.sqrt(np.mean(samples * samples)))
         return rms < threshold
 
+    # async wrappers: the numpy passes above hold the gil for milliseconds
+    # on multi-second buffers, so event-loop callers offload them to the
+    # default thread pool instead of stalling other connections
+
+    async def aresample(self, audio_data: bytes, target_sample_rate: int) -> bytes:
+        """async resample; runs the numpy pass in a worker thread."""
+        return await asyncio.to_thread(self.resample, audio_data, target_sample_rate)
+
+    async def anormalize_audio(
+        self, audio_data: bytes, target_level: float = 0.9
+    ) -> bytes:
+        """async normalize_audio; runs the numpy pass in a worker thread."""
+        return await asyncio.to_thread(self.normalize_audio, audio_data, target_level)
+
+    async def adetect_silence(
+        self,
+        audio_data: bytes,
+        threshold: int = 500,
+        min_duration: float = 0.5,
+    ) -> bool:
+        """async detect_silence; runs the numpy pass in a worker thread."""
+        return await asyncio.to_thread(
+            self.detect_silence, audio_data, threshold, min_duration
+        )
+
+
+# pool of reusable accumulator backing buffers, keyed by capacity.
+# recording sessions create and drop accumulators frequently; recycling
+# their bytearrays avoids re-zeroing and reallocating the same half-second
+# buffer over and over
+_BUFFER_POOL: dict[int, list[bytearray]] = {}
+_BUFFER_POOL_MAX = 8  # per capacity
+
+
+def _acquire_buffer(capacity: int) -> bytearray:
+    """take a pooled buffer of the given capacity, or allocate one."""
+    pooled = _BUFFER_POOL.get(capacity)
+    if pooled:
+        return pooled.pop()
+    return bytearray(capacity)
+
+
+def _release_buffer(buffer: bytearray):
+    """return a buffer to the pool for reuse (dropped when pool is full)."""
+    pooled = _BUFFER_POOL.setdefault(len(buffer), [])
+    if len(pooled) < _BUFFER_POOL_MAX:
+        pooled.append(buffer)
+
 
 class AudioChunkAccumulator:
     """
     accumulates audio chunks until a minimum duration is reached.
     useful for batching audio for apis that work better with longer segments.
+    backed by a preallocated (and pooled) bytearray plus a write offset,
+    so adding a chunk is a slice assignment with no object churn.
     """
 
     def __init__(
@@ -271,11 +342,18 @@ class AudioChunkAccumulator:
         self.min_duration = min_duration
         self.sample_rate = sample_rate
         self.bytes_per_sample = bytes_per_sample
-        self.buffer = io.BytesIO()
 
         # calculate minimum bytes needed
         self.min_bytes = int(min_duration * sample_rate * bytes_per_sample)
 
+        self._buffer = _acquire_buffer(self.min_bytes)
+        self._size = 0  # write offset into the backing buffer
+
+        # running sum of squared samples, maintained as chunks arrive so
+        # the silence decision at flush time needs no second pass
+        self._sum_sq = 0
+        self._n = 0
+
     def add_chunk(self, chunk: bytes) -> Optional[bytes]:
         """
         add a chunk to the buffer.
@@ -287,9 +365,25 @@ class AudioChunkAccumulator:
         returns:
             accumulated audio bytes if ready, none otherwise
         """
-        self.buffer.write(chunk)
-
-        if self.buffer.tell() >= self.min_bytes:
+        # fold the vad statistics into the ingest pass while the chunk is
+        # already hot in cache, instead of rescanning the buffer later.
+        # count= bounds the view to whole samples so an odd-length (or
+        # non-pcm) chunk can never make ingest raise
+        whole_samples = len(chunk) // 2
+        if whole_samples:
+            samples = np.frombuffer(
+                chunk, dtype="<i2", count=whole_samples
+            ).astype(np.int32)
+            self._sum_sq += int((samples * samples).sum())
+            self._n += whole_samples
+
+        needed = self._size + len(chunk)
+        if needed > len(self._buffer):
+            self._buffer.extend(bytes(needed - len(self._buffer)))
+        self._buffer[self._size:needed] = chunk
+        self._size = needed
+
+        if self._size >= self.min_bytes:
             return self.flush()
 
         return None
@@ -297,16 +391,50 @@ class AudioChunkAccumulator:
     def flush(self) -> bytes:
         """
         flush all accumulated audio from the buffer.
-        returns the accumulated data and resets the buffer.
+        returns the accumulated data and resets the write offset;
+        the backing buffer itself is kept for the next round.
 
         returns:
             all accumulated audio bytes
         """
-        self.buffer.seek(0)
-        data = self.buffer.read()
-        self.buffer = io.BytesIO()
+        data = bytes(self._buffer[:self._size])
+        self._size = 0
+        self._sum_sq = 0
+        self._n = 0
         return data
 
+    def rms(self) -> float:
+        """root-mean-square level of the buffered audio, from the running sums."""
+        return math.sqrt(self._sum_sq / self._n) if self._n else 0.0
+
+    def is_silent(self, threshold: int = 500) -> bool:
+        """
+        whether the buffered audio is below the silence threshold.
+        free at decision time: the statistics were accumulated during
+        add_chunk, so no pass over the bytes happens here.
+
+        args:
+            threshold: rms amplitude below which is considered silence
+
+        returns:
+            true if the buffered audio appears to be silence
+        """
+        return self.rms() < threshold
+
     def reset(self):
         """clear the buffer without returning data."""
-        self.buffer = io.BytesIO()
+        self._size = 0
+        self._sum_sq = 0
+        self._n = 0
+
+    def release(self):
+        """
+        hand the backing buffer back to the shared pool.
+        call when the accumulator is no longer needed; the accumulator
+        must not be used afterwards.
+        """
+        self._size = 0
+        self._sum_sq = 0
+        self._n = 0
+        _release_buffer(self._buffer)
+        self._buffer = bytearray(0)